@@ -3,10 +3,13 @@ from django.contrib import admin
 from .models import Post, Category, Location, Comment
 
 
+SHORT_TEXT_LENGTH = 80
+
+
 class PostAdmin(admin.ModelAdmin):
     list_display = (
         'title',
-        'text',
+        'short_text',
         'pub_date',
         'is_published',
         'author',
@@ -19,9 +22,15 @@ class PostAdmin(admin.ModelAdmin):
         'category'
     )
 
+    list_select_related = ('author', 'category', 'location')
+    raw_id_fields = ('author', 'location')
     search_fields = ('title',)
     list_filter = ('category',)
 
+    @admin.display(description='Текст')
+    def short_text(self, obj):
+        return obj.text[:SHORT_TEXT_LENGTH]
+
 
 class CategoryAdmin(admin.ModelAdmin):
     list_display = (
@@ -35,7 +44,23 @@ class CategoryAdmin(admin.ModelAdmin):
     )
 
 
+class CommentAdmin(admin.ModelAdmin):
+    list_display = (
+        'author',
+        'post',
+        'created_at',
+    )
+    list_select_related = ('author', 'post')
+    list_per_page = 50
+    show_full_result_count = False
+
+    def get_readonly_fields(self, request, obj=None):
+        if obj is not None:
+            return ('post',)
+        return ()
+
+
 admin.site.register(Post, PostAdmin)
 admin.site.register(Category, CategoryAdmin)
 admin.site.register(Location)
-admin.site.register(Comment)
+admin.site.register(Comment, CommentAdmin)
@@ -0,0 +1,114 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.core.cache import caches
+from django.utils.cache import (
+    get_conditional_response, patch_cache_control, patch_response_headers,
+    patch_vary_headers
+)
+from django.utils.http import quote_etag
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+
+
+VERSION_CACHE_ALIAS = 'versions'
+POST_LIST_CACHE_TIMEOUT = 60
+POST_LIST_VERSION_KEY = 'post_list_version'
+COMMENTS_CACHE_TIMEOUT = 300
+COMMENTS_VERSION_KEY = 'post_comments_version_{post_id}'
+
+
+def get_version(key):
+    """Функция для получения текущей версии кеша по ключу."""
+    return caches[VERSION_CACHE_ALIAS].get_or_set(key, time.time_ns, None)
+
+
+def bump_version(key):
+    """Функция для сброса кеша сменой его версии.
+    Версией служит время в наносекундах, поэтому новая версия
+    не совпадёт с прежними, даже если ключ был вытеснен из кеша.
+    """
+    caches[VERSION_CACHE_ALIAS].set(key, time.time_ns(), None)
+
+
+def get_post_list_version():
+    """Функция для получения текущей версии кеша списков постов."""
+    return get_version(POST_LIST_VERSION_KEY)
+
+
+def get_comments_version(post_id):
+    """Функция для получения версии кеша комментариев поста."""
+    return get_version(COMMENTS_VERSION_KEY.format(post_id=post_id))
+
+
+def cache_post_list(view):
+    """Декоратор для кеширования страниц со списками постов.
+    Префикс ключа содержит версию кеша, поэтому изменение
+    постов, комментариев, категорий или местоположений
+    сразу делает сохранённые страницы неактуальными.
+    Страницы различаются по cookie, чтобы шапка
+    авторизованного пользователя не попала к другим.
+    Браузер не хранит страницу сам, а каждый раз
+    переспрашивает сервер по ETag. ETag проверяется
+    до обращения к кешу страниц, поэтому совпавший ETag
+    даёт ответ 304 без тела.
+    """
+    view = vary_on_cookie(view)
+
+    def require_revalidation(response):
+        patch_response_headers(response, cache_timeout=0)
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    @wraps(view)
+    def revalidated_view(request, *args, **kwargs):
+        return require_revalidation(view(request, *args, **kwargs))
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        etag = quote_etag(post_list_etag(request, *args, **kwargs))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            cached_view = cache_page(
+                POST_LIST_CACHE_TIMEOUT,
+                key_prefix=f'post_list_{get_post_list_version()}'
+            )(revalidated_view)
+            response = cached_view(request, *args, **kwargs)
+        else:
+            patch_vary_headers(response, ('Cookie',))
+            require_revalidation(response)
+        if request.method in ('GET', 'HEAD'):
+            response['ETag'] = etag
+        return response
+    return wrapper
+
+
+def get_csrf_fingerprint(request):
+    """Функция для получения отпечатка CSRF-токена запроса.
+    Токен меняется при входе пользователя, поэтому страница
+    с формой из кеша браузера после этого становится неактуальной.
+    """
+    token = request.META.get('CSRF_COOKIE', '')
+    return hashlib.sha1(token.encode()).hexdigest()[:12]
+
+
+def post_list_etag(request, *args, **kwargs):
+    """Функция для вычисления ETag страниц со списками постов.
+    Учитывает версию кеша, пользователя, CSRF-токен и интервал
+    времени, чтобы отложенные публикации появлялись без изменений в базе.
+    """
+    return '{version}-{user}-{csrf}-{period}'.format(
+        version=get_post_list_version(),
+        user=request.user.pk,
+        csrf=get_csrf_fingerprint(request),
+        period=int(time.time() // POST_LIST_CACHE_TIMEOUT)
+    )
+
+
+def post_detail_etag(request, post_id, *args, **kwargs):
+    """Функция для вычисления ETag страницы поста."""
+    return '{post_list_etag}-{comments}'.format(
+        post_list_etag=post_list_etag(request),
+        comments=get_comments_version(post_id)
+    )
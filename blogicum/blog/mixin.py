@@ -1,7 +1,7 @@
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 
-from .models import Comment
+from .models import Comment, Post
 
 
 class CommentMixin:
@@ -10,21 +10,44 @@ class CommentMixin:
     model = Comment
 
     def get_object(self):
-        return get_object_or_404(Comment,
-                                 pk=self.kwargs.get('comment_id'),
-                                 post_id=self.kwargs.get('post_id'))
+        if getattr(self, '_cached_object', None) is None:
+            self._cached_object = get_object_or_404(
+                Comment,
+                pk=self.kwargs.get('comment_id'),
+                post_id=self.kwargs.get('post_id')
+            )
+        return self._cached_object
 
     def dispatch(self, request, *args, **kwargs):
         comment = self.get_object()
-        if comment.author != self.request.user:
+        if comment.author_id != self.request.user.pk:
             return redirect('blog:post_detail', post_id=comment.post_id)
         return super().dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['comment'] = self.get_object()
+        context['comment'] = self.object
         return context
 
     def get_success_url(self):
         return reverse('blog:post_detail',
                        kwargs={'post_id': self.kwargs.get('post_id')})
+
+
+class PostMixin:
+    """Миксин для объектов редактирования и удаления постов."""
+
+    model = Post
+    template_name = 'blog/create.html'
+    pk_url_kwarg = 'post_id'
+
+    def get_object(self):
+        if getattr(self, '_cached_object', None) is None:
+            self._cached_object = super().get_object()
+        return self._cached_object
+
+    def dispatch(self, request, *args, **kwargs):
+        post = self.get_object()
+        if post.author_id != self.request.user.pk:
+            return redirect('blog:post_detail', post_id=post.pk)
+        return super().dispatch(request, *args, **kwargs)
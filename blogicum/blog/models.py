@@ -1,12 +1,59 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.utils import timezone
 
 from core.models import IsPublishedAndCreatedModel, TitleModel, MAX_LENGTH
 
 
 User = get_user_model()
 
+POST_CARD_FIELDS = (
+    'id',
+    'title',
+    'text',
+    'pub_date',
+    'image',
+    'is_published',
+    'comment_count',
+    'author',
+    'author__username',
+    'category',
+    'category__slug',
+    'category__title',
+    'category__is_published',
+    'location',
+    'location__name',
+    'location__is_published',
+)
+
+
+class PostQuerySet(models.QuerySet):
+    """Набор запросов для модели Post."""
+
+    def with_related(self):
+        """Подгружает автора, категорию и местоположение."""
+        return self.select_related('author', 'category', 'location')
+
+    def published(self):
+        """Оставляет только опубликованные посты."""
+        return self.filter(
+            pub_date__lt=timezone.now(),
+            is_published=True,
+            category__is_published=True
+        )
+
+    def only_card_fields(self, with_author=True):
+        """Ограничивает выборку полями карточки поста.
+        Без автора поля связанной модели пользователя не выбираются.
+        """
+        if with_author:
+            return self.only(*POST_CARD_FIELDS)
+        return self.only(*(
+            field for field in POST_CARD_FIELDS
+            if not field.startswith('author__')
+        ))
+
 
 class Post(IsPublishedAndCreatedModel, TitleModel):
     """Таблица Постов"""
@@ -42,11 +89,33 @@ class Post(IsPublishedAndCreatedModel, TitleModel):
         related_query_name='post'
     )
     image = models.ImageField('Фото', upload_to='posts_images', blank=True)
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев',
+        default=0,
+        editable=False
+    )
+
+    objects = PostQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('pub_date',)
+        indexes = (
+            models.Index(
+                fields=('-pub_date',),
+                condition=models.Q(is_published=True),
+                name='post_published_pub_date_idx'
+            ),
+            models.Index(
+                fields=('category', '-pub_date'),
+                name='post_category_pub_date_idx'
+            ),
+            models.Index(
+                fields=('author', '-pub_date'),
+                name='post_author_pub_date_idx'
+            ),
+        )
 
     def __str__(self):
         return self.title
@@ -87,6 +156,21 @@ class Location(IsPublishedAndCreatedModel):
         return self.name
 
 
+class CommentQuerySet(models.QuerySet):
+    """Набор запросов для модели Comment."""
+
+    def with_author(self):
+        """Подгружает автора, ограничивая выборку выводимыми полями."""
+        return self.select_related('author').only(
+            'id',
+            'text',
+            'created_at',
+            'post',
+            'author',
+            'author__username'
+        )
+
+
 class Comment(models.Model):
     text = models.TextField('Текст комментария')
     post = models.ForeignKey(
@@ -98,6 +182,8 @@ class Comment(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE,
                                related_name='comments')
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
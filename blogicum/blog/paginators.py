@@ -0,0 +1,22 @@
+from django.core.paginator import Paginator
+
+
+class PkSlicePaginator(Paginator):
+    """Пагинатор, который сначала выбирает ключи постов страницы.
+    Смещение вычисляется во вложенном запросе из одних pk,
+    а полные строки загружаются только для найденных ключей.
+    """
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        return self._get_page(
+            self.object_list.filter(
+                pk__in=self.object_list.values('pk')[bottom:top]
+            ),
+            number,
+            self
+        )
@@ -0,0 +1,146 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .caching import (
+    COMMENTS_VERSION_KEY, POST_LIST_VERSION_KEY, bump_version
+)
+from .models import Category, Comment, Location, Post, User
+
+
+class ChangeSet:
+    """Изменения блога в рамках одной транзакции.
+    При удалении нескольких объектов версия кеша сбрасывается
+    один раз, после последнего из них. После коммита изменённые
+    версии сбрасываются ещё раз, чтобы отбросить страницы,
+    закешированные другими запросами до коммита.
+    """
+
+    def __init__(self):
+        self.changed_keys = set()
+        self.pending_deletes = Counter()
+        self.deleted_post_ids = set()
+
+    def change(self, key):
+        self.changed_keys.add(key)
+        bump_version(key)
+
+    def start_delete(self, key):
+        self.pending_deletes[key] += 1
+
+    def finish_delete(self, key):
+        if self.pending_deletes[key] > 1:
+            self.pending_deletes[key] -= 1
+            return
+        del self.pending_deletes[key]
+        self.change(key)
+
+    def __call__(self):
+        for key in self.changed_keys:
+            bump_version(key)
+
+
+def get_change_set():
+    """Функция для получения изменений текущей транзакции.
+    Вне транзакции каждое изменение обрабатывается сразу.
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        return ChangeSet()
+    for _, hook in connection.run_on_commit:
+        if isinstance(hook, ChangeSet):
+            return hook
+    change_set = ChangeSet()
+    transaction.on_commit(change_set)
+    return change_set
+
+
+def get_comments_key(comment):
+    return COMMENTS_VERSION_KEY.format(post_id=comment.post_id)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Location)
+def invalidate_post_list_cache(sender, **kwargs):
+    get_change_set().change(POST_LIST_VERSION_KEY)
+
+
+@receiver(pre_delete, sender=Post)
+@receiver(pre_delete, sender=Comment)
+@receiver(pre_delete, sender=Category)
+@receiver(pre_delete, sender=Location)
+def start_post_list_delete(sender, **kwargs):
+    get_change_set().start_delete(POST_LIST_VERSION_KEY)
+
+
+@receiver(post_delete, sender=Post)
+@receiver(post_delete, sender=Comment)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Location)
+def finish_post_list_delete(sender, **kwargs):
+    get_change_set().finish_delete(POST_LIST_VERSION_KEY)
+
+
+@receiver(post_save, sender=Comment)
+def invalidate_comments_cache(sender, instance, **kwargs):
+    get_change_set().change(get_comments_key(instance))
+
+
+@receiver(pre_delete, sender=Comment)
+def start_comments_delete(sender, instance, **kwargs):
+    get_change_set().start_delete(get_comments_key(instance))
+
+
+@receiver(post_delete, sender=Comment)
+def finish_comments_delete(sender, instance, **kwargs):
+    get_change_set().finish_delete(get_comments_key(instance))
+
+
+@receiver(post_save, sender=User)
+def invalidate_author_cache(sender, instance, created, update_fields,
+                            **kwargs):
+    if created or (
+        update_fields is not None and 'username' not in update_fields
+    ):
+        return
+    change_set = get_change_set()
+    change_set.change(POST_LIST_VERSION_KEY)
+    post_ids = (
+        Comment.objects.filter(author_id=instance.pk)
+        .values_list('post_id', flat=True)
+        .distinct()
+    )
+    for post_id in post_ids:
+        change_set.change(COMMENTS_VERSION_KEY.format(post_id=post_id))
+
+
+@receiver(pre_delete, sender=Post)
+def start_post_delete(sender, instance, **kwargs):
+    get_change_set().deleted_post_ids.add(instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def finish_post_delete(sender, instance, **kwargs):
+    get_change_set().deleted_post_ids.discard(instance.pk)
+
+
+@receiver(post_save, sender=Comment)
+def increase_comment_count(sender, instance, created, **kwargs):
+    if created and not kwargs.get('raw'):
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comment_count(sender, instance, **kwargs):
+    if instance.post_id in get_change_set().deleted_post_ids:
+        return
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    )
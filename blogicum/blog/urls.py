@@ -1,6 +1,7 @@
 from django.urls import path, include
 
 from . import views
+from .caching import cache_post_list
 
 
 app_name = 'blog'
@@ -22,12 +23,13 @@ post_urls = [
 ]
 
 urlpatterns = [
-    path('', views.PostListView.as_view(), name='index'),
+    path('', cache_post_list(views.PostListView.as_view()), name='index'),
     path('posts/', include(post_urls)),
     path('profile_edit/', views.ProfileUpdateView.as_view(),
          name='edit_profile'),
     path('profile/<str:username>/', views.ProfileListView.as_view(),
          name='profile'),
-    path('category/<slug:category>/', views.CategoryListView.as_view(),
+    path('category/<slug:category>/',
+         cache_post_list(views.CategoryListView.as_view()),
          name='category_posts'),
 ]
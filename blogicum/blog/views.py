@@ -1,42 +1,27 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count
+from django.core.paginator import Paginator
+from django.db.models import Q
 from django.http import Http404
-from django.shortcuts import get_object_or_404, redirect
+from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django.views.generic import (
     ListView, DeleteView, CreateView, UpdateView, DetailView
 )
 
 from .models import Post, Category, User, Comment
+from .caching import (
+    COMMENTS_CACHE_TIMEOUT, get_comments_version, post_detail_etag
+)
 from .forms import BlogForm, CommentForm, ProfileForm
-from .mixin import CommentMixin
+from .mixin import CommentMixin, PostMixin
+from .paginators import PkSlicePaginator
 
 
 POSTS_IN_PAGE = 10
-
-
-def get_post_object(filter=False, annotate_sort=False):
-    """Функция для получения данных модели Post.
-    Данные можно получить дополнительно их отфильтровав
-    или добавив счётчик комментариев и сортировку.
-    """
-    post_query = Post.objects.select_related(
-        'author',
-        'category',
-        'location'
-    )
-    if filter:
-        post_query = post_query.filter(
-            pub_date__lt=timezone.now(),
-            is_published=True,
-            category__is_published=True
-        )
-    if annotate_sort:
-        post_query = post_query.annotate(
-            comment_count=Count('comments')
-        ).order_by('-pub_date')
-    return post_query
+COMMENTS_IN_PAGE = 50
 
 
 class PostCreateView(LoginRequiredMixin, CreateView):
@@ -59,44 +44,37 @@ class PostCreateView(LoginRequiredMixin, CreateView):
 class PostListView(ListView):
     """Объект для отображения постов на главной странице."""
 
-    queryset = get_post_object(filter=True, annotate_sort=True)
     paginate_by = POSTS_IN_PAGE
+    paginator_class = PkSlicePaginator
     template_name = 'blog/index.html'
 
+    def get_queryset(self):
+        return (
+            Post.objects.with_related()
+            .published()
+            .only_card_fields()
+            .order_by('-pub_date')
+        )
 
-class PostUpdateView(LoginRequiredMixin, UpdateView):
+
+class PostUpdateView(PostMixin, LoginRequiredMixin, UpdateView):
     """Объект для обновление постов."""
 
-    model = Post
     form_class = BlogForm
-    template_name = 'blog/create.html'
-    pk_url_kwarg = 'post_id'
-
-    def dispatch(self, request, *args, **kwargs):
-        get_post = self.get_object()
-        if get_post.author != self.request.user:
-            return redirect('blog:post_detail', post_id=get_post.pk)
-        return super().dispatch(request, *args, **kwargs)
 
 
-class PostDeleteView(LoginRequiredMixin, DeleteView):
+class PostDeleteView(PostMixin, LoginRequiredMixin, DeleteView):
     """Объект для удаления постов."""
 
-    model = Post
-    template_name = 'blog/create.html'
-    pk_url_kwarg = 'post_id'
-
-    def dispatch(self, request, *args, **kwargs):
-        post = self.get_object()
-        if post.author != self.request.user:
-            return redirect('blog:post_detail', post_id=post.pk)
-        return super().dispatch(request, *args, **kwargs)
+    def get_queryset(self):
+        return Post.objects.only('id', 'title', 'author')
 
     def get_success_url(self) -> str:
         return reverse('blog:profile',
                        kwargs={'username': self.request.user.username})
 
 
+@method_decorator(condition(etag_func=post_detail_etag), name='dispatch')
 class PostsDetailView(DetailView):
     """Объект для отображения определенного поста."""
 
@@ -104,18 +82,26 @@ class PostsDetailView(DetailView):
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_id'
 
-    def get_object(self):
-        post = get_object_or_404(get_post_object(), pk=self.kwargs['post_id'])
-        if (post.author != self.request.user
-                and (not post.is_published or not post.category.is_published
-                     or post.pub_date > timezone.now())):
-            raise Http404('You do not have permission to view this post.')
-        return post
+    def get_queryset(self):
+        visible = Q(
+            pub_date__lt=timezone.now(),
+            is_published=True,
+            category__is_published=True
+        )
+        if self.request.user.is_authenticated:
+            visible |= Q(author_id=self.request.user.pk)
+        return Post.objects.with_related().filter(visible)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['form'] = CommentForm()
-        context['comments'] = self.object.comments.select_related('author')
+        if self.request.user.is_authenticated:
+            context['form'] = CommentForm()
+        context['page_obj'] = Paginator(
+            self.object.comments.with_author().order_by('created_at'),
+            COMMENTS_IN_PAGE
+        ).get_page(self.request.GET.get('page'))
+        context['comments_version'] = get_comments_version(self.object.pk)
+        context['comments_cache_timeout'] = COMMENTS_CACHE_TIMEOUT
         return context
 
 
@@ -124,21 +110,32 @@ class CategoryListView(ListView):
 
     template_name = 'blog/category.html'
     paginate_by = POSTS_IN_PAGE
+    paginator_class = PkSlicePaginator
     context_object_name = 'post'
 
     def get_object_category_by_slug(self):
         """Метод для получения категории"""
-        return get_object_or_404(Category, slug=self.kwargs['category'],
-                                 is_published=True)
+        if getattr(self, '_cached_category', None) is None:
+            self._cached_category = get_object_or_404(
+                Category.objects.only('id', 'title', 'description'),
+                slug=self.kwargs['category'],
+                is_published=True
+            )
+        return self._cached_category
 
     def get_queryset(self):
-        get_category = self.get_object_category_by_slug()
-        return get_post_object(filter=True, annotate_sort=True).filter(
-            category=get_category)
+        self.category = self.get_object_category_by_slug()
+        return (
+            Post.objects.with_related()
+            .published()
+            .filter(category_id=self.category.pk)
+            .only_card_fields()
+            .order_by('-pub_date')
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['category'] = self.get_object_category_by_slug()
+        context['category'] = self.category
         return context
 
 
@@ -150,8 +147,10 @@ class CommentCreateView(LoginRequiredMixin, CreateView):
     template_name = 'blog/comment.html'
 
     def form_valid(self, form):
+        if not Post.objects.filter(pk=self.kwargs['post_id']).exists():
+            raise Http404('Post does not exist.')
         form.instance.author = self.request.user
-        form.instance.post = get_object_or_404(Post, pk=self.kwargs['post_id'])
+        form.instance.post_id = self.kwargs['post_id']
         return super().form_valid(form)
 
     def get_success_url(self):
@@ -181,20 +180,37 @@ class ProfileListView(ListView):
     context_object_name = 'profile'
     slug_url_kwarg = 'username'
     paginate_by = POSTS_IN_PAGE
+    paginator_class = PkSlicePaginator
 
     def get_object(self):
-        username = self.kwargs.get('username')
-        return get_object_or_404(User, username=username)
+        if getattr(self, '_cached_object', None) is None:
+            self._cached_object = get_object_or_404(
+                User.objects.only(
+                    'id',
+                    'username',
+                    'first_name',
+                    'last_name',
+                    'date_joined',
+                    'is_staff'
+                ),
+                username=self.kwargs.get('username')
+            )
+        return self._cached_object
 
     def get_queryset(self):
         user_object = self.get_object()
-        return get_post_object(filter=self.request.user != user_object,
-                               annotate_sort=True).filter(
-                                   author=user_object)
+        posts = Post.objects.select_related('category', 'location').filter(
+            author_id=user_object.pk
+        )
+        if self.request.user.pk != user_object.pk:
+            posts = posts.published()
+        return posts.only_card_fields(with_author=False).order_by('-pub_date')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['profile'] = self.get_object()
+        for post in context['page_obj']:
+            post.author = context['profile']
         return context
 
 
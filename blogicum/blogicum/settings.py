@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 
@@ -59,6 +60,37 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'blogicum.wsgi.application'
 
+# Версии кеша должны быть общими для всех процессов сервера,
+# поэтому при запуске нескольких воркеров нужно указать адрес
+# Memcached в MEMCACHED_LOCATION. Без него кеш хранится в памяти
+# процесса и подходит только для запуска в одном процессе.
+# Версии лежат в отдельном кеше, чтобы их не вытесняли страницы.
+MEMCACHED_LOCATION = os.getenv('MEMCACHED_LOCATION')
+
+if MEMCACHED_LOCATION:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': MEMCACHED_LOCATION,
+        },
+        'versions': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': MEMCACHED_LOCATION,
+            'KEY_PREFIX': 'versions',
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        'versions': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'versions',
+            'OPTIONS': {'MAX_ENTRIES': 100000},
+        },
+    }
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
@@ -0,0 +1,131 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache, caches
+from django.utils import timezone
+
+from blog.caching import VERSION_CACHE_ALIAS, get_version
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    cache.clear()
+    caches[VERSION_CACHE_ALIAS].clear()
+    yield
+    cache.clear()
+    caches[VERSION_CACHE_ALIAS].clear()
+
+
+@pytest.fixture
+def published_post_factory(mixer, user):
+    def factory(**kwargs):
+        return mixer.blend(
+            'blog.Post',
+            author=user,
+            is_published=True,
+            category__is_published=True,
+            pub_date=timezone.now() - timedelta(days=1),
+            **kwargs
+        )
+    return factory
+
+
+@pytest.fixture
+def published_post(published_post_factory):
+    return published_post_factory()
+
+
+def get_post_url(post):
+    return f'/posts/{post.id}/'
+
+
+@pytest.mark.django_db
+def test_new_post_shows_on_cached_index(user_client, published_post_factory):
+    user_client.get('/')
+    post = published_post_factory(title='Свежая публикация')
+    response = user_client.get('/')
+    assert post.title in response.content.decode('utf-8'), (
+        'Убедитесь, что новый пост сразу появляется на главной странице, '
+        'даже если она была закеширована.'
+    )
+
+
+@pytest.mark.django_db
+def test_new_comment_shows_on_cached_post_page(
+        mixer, user_client, published_post
+):
+    url = get_post_url(published_post)
+    mixer.blend('blog.Comment', post=published_post, text='Первый')
+    user_client.get(url)
+    mixer.blend('blog.Comment', post=published_post, text='Второй')
+    content = user_client.get(url).content.decode('utf-8')
+    assert 'Первый' in content and 'Второй' in content, (
+        'Убедитесь, что новый комментарий сразу появляется на странице '
+        'поста, даже если комментарии были закешированы.'
+    )
+
+
+@pytest.mark.django_db
+def test_username_change_shows_in_cached_comments(
+        mixer, user_client, another_user, published_post
+):
+    url = get_post_url(published_post)
+    mixer.blend('blog.Comment', post=published_post, author=another_user)
+    user_client.get(url)
+    another_user.username = 'renamed_author'
+    another_user.save()
+    content = user_client.get(url).content.decode('utf-8')
+    assert '@renamed_author' in content, (
+        'Убедитесь, что смена имени пользователя сразу отображается '
+        'в закешированных комментариях.'
+    )
+
+
+@pytest.mark.django_db
+def test_cached_index_revalidates_by_etag(user_client, published_post):
+    first = user_client.get('/')
+    assert 'no-cache' in first['Cache-Control']
+    assert 'max-age=0' in first['Cache-Control']
+    response = user_client.get('/', HTTP_IF_NONE_MATCH=first['ETag'])
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+        'Убедитесь, что закешированная главная страница '
+        'отвечает 304 на совпавший ETag.'
+    )
+
+
+@pytest.mark.django_db
+def test_post_page_etag_changes_with_comments(
+        mixer, user_client, published_post
+):
+    url = get_post_url(published_post)
+    user_client.get(url)
+    etag = user_client.get(url)['ETag']
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    mixer.blend('blog.Comment', post=published_post)
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        'Убедитесь, что новый комментарий меняет ETag страницы поста.'
+    )
+
+
+@pytest.mark.django_db
+def test_post_page_etag_changes_with_csrf_token(user_client, published_post):
+    url = get_post_url(published_post)
+    user_client.get(url)
+    etag = user_client.get(url)['ETag']
+    user_client.cookies['csrftoken'] = 'a' * 64
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        'Убедитесь, что смена CSRF-токена меняет ETag страницы поста.'
+    )
+
+
+def test_lost_version_is_not_reused():
+    version = get_version('test_version')
+    caches[VERSION_CACHE_ALIAS].delete('test_version')
+    assert get_version('test_version') != version, (
+        'Убедитесь, что версия кеша, вытесненная из кеша, '
+        'не повторяет прежнее значение.'
+    )
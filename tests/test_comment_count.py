@@ -0,0 +1,90 @@
+from importlib import import_module
+
+import pytest
+from django.apps import apps
+from django.core import serializers
+
+from blog.models import Comment, Post
+
+fill_comment_count = import_module(
+    'blog.migrations.0013_post_comment_count'
+).fill_comment_count
+
+
+@pytest.fixture
+def post(mixer, user):
+    return mixer.blend('blog.Post', author=user)
+
+
+@pytest.fixture
+def another_post(mixer, user):
+    return mixer.blend('blog.Post', author=user)
+
+
+def get_comment_count(post):
+    post.refresh_from_db(fields=['comment_count'])
+    return post.comment_count
+
+
+@pytest.mark.django_db
+def test_comment_count_follows_create_and_delete(mixer, post):
+    comments = mixer.cycle(3).blend('blog.Comment', post=post)
+    assert get_comment_count(post) == 3, (
+        'Убедитесь, что создание комментария увеличивает '
+        'счётчик комментариев поста.'
+    )
+    comments[0].delete()
+    assert get_comment_count(post) == 2, (
+        'Убедитесь, что удаление комментария уменьшает '
+        'счётчик комментариев поста.'
+    )
+    comments[1].text = 'Изменённый текст'
+    comments[1].save()
+    assert get_comment_count(post) == 2, (
+        'Убедитесь, что редактирование комментария '
+        'не меняет счётчик комментариев поста.'
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_on_cascade_delete(
+        mixer, user, another_user, post, another_post
+):
+    mixer.cycle(3).blend('blog.Comment', post=post)
+    mixer.blend('blog.Comment', post=another_post, author=another_user)
+    mixer.blend('blog.Comment', post=another_post, author=user)
+    post.delete()
+    assert get_comment_count(another_post) == 2, (
+        'Убедитесь, что удаление поста с комментариями '
+        'не меняет счётчики других постов.'
+    )
+    another_user.delete()
+    assert get_comment_count(another_post) == 1, (
+        'Убедитесь, что удаление пользователя уменьшает счётчики '
+        'постов, к которым он оставлял комментарии.'
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_on_raw_load(mixer, post):
+    mixer.cycle(2).blend('blog.Comment', post=post)
+    post.refresh_from_db()
+    data = serializers.serialize(
+        'json', [post, *Comment.objects.filter(post=post)]
+    )
+    Comment.objects.filter(post=post).delete()
+    for obj in serializers.deserialize('json', data):
+        obj.save()
+    assert get_comment_count(post) == 2, (
+        'Убедитесь, что загрузка фикстур не увеличивает '
+        'счётчик комментариев повторно.'
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_backfill(mixer, post, another_post):
+    mixer.cycle(3).blend('blog.Comment', post=post)
+    Post.objects.update(comment_count=0)
+    fill_comment_count(apps, None)
+    assert get_comment_count(post) == 3
+    assert get_comment_count(another_post) == 0
@@ -0,0 +1,27 @@
+import pytest
+
+from blog.views import COMMENTS_IN_PAGE
+from test_caching import (  # noqa: F401
+    clear_caches, get_post_url, published_post, published_post_factory
+)
+
+
+@pytest.mark.django_db
+def test_post_page_paginates_comments(mixer, user_client, published_post):
+    comments = mixer.cycle(COMMENTS_IN_PAGE + 5).blend(
+        'blog.Comment', post=published_post
+    )
+    url = get_post_url(published_post)
+    first_page = user_client.get(url).context['page_obj']
+    assert len(first_page) == COMMENTS_IN_PAGE, (
+        f'Убедитесь, что на странице поста выводится не больше '
+        f'{COMMENTS_IN_PAGE} комментариев.'
+    )
+    assert first_page.has_next()
+    last_page = user_client.get(url, {'page': 2}).context['page_obj']
+    assert [comment.pk for comment in last_page] == [
+        comment.pk for comment in comments[COMMENTS_IN_PAGE:]
+    ], (
+        'Убедитесь, что остальные комментарии выводятся на следующей '
+        'странице в порядке их создания.'
+    )
@@ -0,0 +1,45 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+
+from test_caching import (  # noqa: F401
+    clear_caches, get_post_url, published_post, published_post_factory
+)
+
+
+@pytest.fixture(params=['unpublished', 'future', 'unpublished_category'])
+def hidden_post(request, published_post):
+    if request.param == 'unpublished':
+        published_post.is_published = False
+    elif request.param == 'future':
+        published_post.pub_date = timezone.now() + timedelta(days=1)
+    else:
+        published_post.category.is_published = False
+        published_post.category.save()
+    published_post.save()
+    return published_post
+
+
+@pytest.mark.django_db
+def test_hidden_post_is_visible_only_to_author(
+        user_client, another_user_client, unlogged_client, hidden_post
+):
+    url = get_post_url(hidden_post)
+    assert user_client.get(url).status_code == HTTPStatus.OK, (
+        'Убедитесь, что автор видит свой скрытый пост.'
+    )
+    for client in (another_user_client, unlogged_client):
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND, (
+            'Убедитесь, что скрытый пост недоступен другим пользователям.'
+        )
+
+
+@pytest.mark.django_db
+def test_published_post_is_visible_to_everyone(
+        another_user_client, unlogged_client, published_post
+):
+    url = get_post_url(published_post)
+    for client in (another_user_client, unlogged_client):
+        assert client.get(url).status_code == HTTPStatus.OK
@@ -0,0 +1,67 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from conftest import N_PER_PAGE
+from test_caching import (  # noqa: F401
+    clear_caches, get_post_url, published_post, published_post_factory
+)
+
+
+def count_queries(client, url):
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        client.get(url)
+    return len(context)
+
+
+def assert_constant_queries(client, url, add_rows, django_assert_num_queries):
+    expected = count_queries(client, url)
+    add_rows()
+    cache.clear()
+    with django_assert_num_queries(expected):
+        client.get(url)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('page', ['index', 'category', 'profile'])
+def test_list_pages_use_constant_queries(
+        page, mixer, user, user_client, another_user_client,
+        published_post_factory, django_assert_num_queries
+):
+    category = mixer.blend('blog.Category', is_published=True)
+    published_post_factory(category=category)
+    url = {
+        'index': '/',
+        'category': f'/category/{category.slug}/',
+        'profile': f'/profile/{user.username}/',
+    }[page]
+    for client in (user_client, another_user_client):
+        assert_constant_queries(
+            client,
+            url,
+            lambda: [
+                published_post_factory(
+                    category=category,
+                    location=mixer.blend('blog.Location'),
+                )
+                for _ in range(N_PER_PAGE // 2)
+            ],
+            django_assert_num_queries
+        )
+
+
+@pytest.mark.django_db
+def test_post_page_uses_constant_queries(
+        mixer, user_client, published_post, django_assert_num_queries
+):
+    mixer.blend('blog.Comment', post=published_post)
+    assert_constant_queries(
+        user_client,
+        get_post_url(published_post),
+        lambda: mixer.cycle(N_PER_PAGE).blend(
+            'blog.Comment', post=published_post
+        ),
+        django_assert_num_queries
+    )